@@ -5,9 +5,6 @@ This package contains a modular, well-structured implementation of the Wordle ga
 following clean architecture principles with proper separation of concerns.
 """
 
-from flask import Flask
-from flask_cors import CORS
-from flask_socketio import SocketIO
 from .config import Config
 
 
@@ -21,8 +18,17 @@ def create_app(config_class=Config):
     Returns:
         Flask application instance with all extensions initialized
     """
+    # Imported here so that importing only app.config or app.models (e.g. to
+    # check the word list) does not load Flask and its extensions. The
+    # services and utils packages still import Flask themselves.
+    from flask import Flask
+    from flask_cors import CORS
+    from flask_socketio import SocketIO
+    from .utils.json_provider import OrjsonProvider
+    
     app = Flask(__name__)
     app.config.from_object(config_class)
+    app.json = OrjsonProvider(app)
     
     # Initialize extensions
     CORS(app)
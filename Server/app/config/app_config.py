@@ -26,6 +26,10 @@ class Config:
     # Database Settings
     MONGO_URI = os.getenv('MONGO_URI')
     
+    # Game Storage Settings (games are kept in memory when REDIS_URL is not set)
+    REDIS_URL = os.getenv('REDIS_URL')
+    GAME_TTL_SECONDS = int(os.getenv('GAME_TTL_SECONDS', 3600))
+    
     # Authentication Settings
     JWT_SECRET = os.getenv('JWT_SECRET')
     JWT_EXPIRATION_DAYS = int(os.getenv('JWT_EXPIRATION_DAYS', 7))
@@ -7,9 +7,10 @@ All game parameters are centralized here to enable easy modification
 
 """
 
+import functools
 import json
 import os
-from typing import List, Final
+from typing import Tuple, Final
 
 # Core Game Configuration Constants (only for single player game)
 MAX_ROUNDS: Final[int] = 6
@@ -19,12 +20,12 @@ Type: Final[int] - Immutable to prevent accidental modification
 """
 
 # Load word list from JSON file
-def _load_word_list() -> List[str]:
+def _load_word_list() -> Tuple[str, ...]:
     """
     Load word list from wordles.json file.
     
     Returns:
-        List[str]: List of uppercase 5-letter words
+        Tuple[str, ...]: Immutable sequence of uppercase 5-letter words
         
     Raises:
         FileNotFoundError: If wordles.json file is not found
@@ -54,21 +55,25 @@ def _load_word_list() -> List[str]:
             if not word.isalpha():
                 raise ValueError(f"Word '{word}' contains non-alphabetic characters")
                 
-        return uppercase_words
+        return tuple(uppercase_words)
         
     except FileNotFoundError:
         raise FileNotFoundError(f"Word list file not found: {json_file_path}")
     except json.JSONDecodeError as e:
         raise json.JSONDecodeError(f"Invalid JSON in wordles.json: {e}")
 
-# Curated Word Database loaded from JSON file
-WORD_LIST: Final[List[str]] = _load_word_list()
+# Curated Word Database loaded from JSON file; a tuple so it can be shared without copying
+WORD_LIST: Final[Tuple[str, ...]] = _load_word_list()
 
 
+@functools.cache
 def validate_word_list_integrity() -> bool:
     """
     Validates the integrity and consistency of the word database.
     
+    WORD_LIST is fixed at import time, so a successful result is cached and
+    later calls return immediately.
+    
     This function performs validation to ensure:
     1. Length validation: All words must be exactly 5 characters
     2. Character validation: Only alphabetic characters allowed
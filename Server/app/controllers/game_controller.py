@@ -5,7 +5,6 @@ Handles all game-related HTTP endpoints.
 """
 
 from flask import Blueprint, request, jsonify
-from dataclasses import asdict
 from ..services.game_service import get_game_service
 from ..services.auth_service import get_auth_service
 from ..utils.game_logger import game_logger
@@ -39,18 +38,18 @@ def new_game():
         game_logger.log_user_action(request, 'new_game', extra_data={'game_mode': game_mode})
         
         game_id = game_service.create_new_game(game_mode)
-        state = game_service.get_game_state(game_id)
+        state = game_service.get_game_state_dict(game_id)
         
         response_data = {
             'success': True,
             'game_id': game_id,
-            'state': asdict(state)
+            'state': state
         }
         
         # Log successful response
         game_logger.log_server_response(
             request, 'new_game', True, response_data, game_id,
-            word_length=5, max_rounds=state.max_rounds
+            word_length=5, max_rounds=state['max_rounds']
         )
         
         return jsonify(response_data)
@@ -82,7 +81,7 @@ def get_state(game_id):
         # Log user action
         game_logger.log_user_action(request, 'get_state', game_id)
         
-        state = game_service.get_game_state(game_id)
+        state = game_service.get_game_state_dict(game_id)
         if state is None:
             error_response = {
                 'success': False,
@@ -93,13 +92,13 @@ def get_state(game_id):
         
         response_data = {
             'success': True,
-            'state': asdict(state)
+            'state': state
         }
         
         # Log successful response
         game_logger.log_server_response(
             request, 'get_state', True, response_data, game_id,
-            current_round=state.current_round, game_over=state.game_over
+            current_round=state['current_round'], game_over=state['game_over']
         )
         
         return jsonify(response_data)
@@ -142,9 +141,9 @@ def make_guess(game_id):
             guess=guess, guess_length=len(guess)
         )
         
-        # Validate guess first
-        is_valid, error = game_service.is_valid_guess(game_id, guess)
-        if not is_valid:
+        # Validate and process guess
+        state, error = game_service.make_guess(game_id, guess)
+        if state is None:
             error_response = {
                 'success': False,
                 'error': error
@@ -155,39 +154,29 @@ def make_guess(game_id):
             )
             return jsonify(error_response), 400
         
-        # Process guess
-        state = game_service.make_guess(game_id, guess)
-        if state is None:
-            error_response = {
-                'success': False,
-                'error': 'Failed to process guess'
-            }
-            game_logger.log_server_response(request, 'submit_guess', False, error_response, game_id)
-            return jsonify(error_response), 500
-        
         response_data = {
             'success': True,
-            'state': asdict(state)
+            'state': state
         }
         
         # Log successful response with game events
         game_logger.log_server_response(
             request, 'submit_guess', True, response_data, game_id,
-            guess=guess, round=state.current_round, game_over=state.game_over
+            guess=guess, round=state['current_round'], game_over=state['game_over']
         )
         
         # Log special game events
-        if state.game_over:
-            if state.won:
+        if state['game_over']:
+            if state['won']:
                 game_logger.log_game_event(
                     game_id, 'game_won', request.remote_addr,
-                    rounds_used=state.current_round, target_word=state.answer,
+                    rounds_used=state['current_round'], target_word=state['answer'],
                     winning_guess=guess
                 )
             else:
                 game_logger.log_game_event(
                     game_id, 'game_lost', request.remote_addr,
-                    rounds_used=state.current_round, target_word=state.answer,
+                    rounds_used=state['current_round'], target_word=state['answer'],
                     final_guess=guess
                 )
         
@@ -256,7 +245,8 @@ def health_check():
         
         response_data = {
             'status': 'healthy',
-            'active_games': len(game_service.games) if game_service else 0,
+            'active_games': game_service.count_games() if game_service else 0,
+            **(game_service.get_stats() if game_service else {}),
             'log_stats': log_stats,
             'auth_available': auth_service is not None,
             'active_sessions': auth_service.get_active_sessions_count() if auth_service else 0,
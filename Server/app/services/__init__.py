@@ -6,10 +6,12 @@ Contains all business logic and service classes.
 
 from .auth_service import AuthService, get_auth_service
 from .game_service import GameService, get_game_service
+from .game_store import InMemoryGameStore, RedisGameStore
 from .lobby_service import LobbyService, get_lobby_service
 
 __all__ = [
     'AuthService', 'get_auth_service',
     'GameService', 'get_game_service', 
+    'InMemoryGameStore', 'RedisGameStore',
     'LobbyService', 'get_lobby_service'
 ]
\ No newline at end of file
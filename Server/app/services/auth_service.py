@@ -54,6 +54,7 @@ class AuthService:
         self.sessions_collection.create_index("token_hash")
         self.sessions_collection.create_index("expires_at", expireAfterSeconds=0)  # TTL index
         self.sessions_collection.create_index("last_activity")  # For activity queries
+        self.sessions_collection.create_index("last_heartbeat")  # For finding expired sessions
     
     def hash_password(self, password: str) -> str:
         """
@@ -508,7 +509,8 @@ class AuthService:
         This is called periodically to clean up disconnected users.
         
         Returns:
-            Dictionary with cleanup results and user information
+            Dictionary with cleanup results and user information; its
+            "sessions_remaining" is False only when no session is stored at all
         """
         try:
             # Find sessions where last_heartbeat is older than timeout
@@ -516,27 +518,48 @@ class AuthService:
                 seconds=current_app.config.get('SESSION_TIMEOUT_SECONDS', 10)
             )
             
+            # The session with the oldest heartbeat tells in one query whether
+            # any session exists and whether any has expired
+            oldest_session = self.sessions_collection.find_one(
+                {}, {"last_heartbeat": 1}, sort=[("last_heartbeat", 1)]
+            )
+            if oldest_session is None:
+                return {"cleaned_count": 0, "disconnected_users": [], "sessions_remaining": False}
+            oldest_heartbeat = oldest_session.get("last_heartbeat")
+            if oldest_heartbeat is not None and oldest_heartbeat >= cutoff_time:
+                return {"cleaned_count": 0, "disconnected_users": [], "sessions_remaining": True}
+            
             # First, get the sessions that will be deleted to log user information
             expired_sessions = list(self.sessions_collection.find({
                 "last_heartbeat": {"$lt": cutoff_time}
             }))
             
+            if not expired_sessions:
+                return {"cleaned_count": 0, "disconnected_users": [], "sessions_remaining": True}
+
+            # Fetch all affected users in one round trip instead of one query per session
+            user_ids = [ObjectId(session["user_id"]) for session in expired_sessions if session.get("user_id")]
+            usernames = {
+                str(user["_id"]): user.get("username", "unknown")
+                for user in self.users_collection.find({"_id": {"$in": user_ids}}, {"username": 1})
+            }
+
             # Get user information for logging
             disconnected_users = []
             for session in expired_sessions:
                 user_id = session.get("user_id")
-                if user_id:
-                    user = self.users_collection.find_one({"_id": ObjectId(user_id)})
-                    if user:
-                        disconnected_users.append({
-                            "user_id": user_id,
-                            "username": user.get("username", "unknown"),
-                            "last_heartbeat": session.get("last_heartbeat"),
-                            "session_duration": (cutoff_time - session.get("created_at", cutoff_time)).total_seconds()
-                        })
-            
-            # Delete expired sessions based on heartbeat timeout
+                if user_id in usernames:
+                    disconnected_users.append({
+                        "user_id": user_id,
+                        "username": usernames[user_id],
+                        "last_heartbeat": session.get("last_heartbeat"),
+                        "session_duration": (cutoff_time - session.get("created_at", cutoff_time)).total_seconds()
+                    })
+
+            # Delete exactly the sessions found above, so a heartbeat arriving in
+            # between is not wiped out
             result = self.sessions_collection.delete_many({
+                "_id": {"$in": [session["_id"] for session in expired_sessions]},
                 "last_heartbeat": {"$lt": cutoff_time}
             })
             
@@ -545,7 +568,8 @@ class AuthService:
             
             return {
                 "cleaned_count": result.deleted_count,
-                "disconnected_users": disconnected_users
+                "disconnected_users": disconnected_users,
+                "sessions_remaining": True  # Not re-checked; the next run will tell
             }
             
         except Exception as e:
@@ -4,12 +4,154 @@ Game Service
 Contains the core game logic for Wordle, Absurdle, and multiplayer games.
 """
 
+import functools
 import random
-import uuid
+import re
+import secrets
+import string
+import threading
 import time
-from typing import Dict, List, Optional, Tuple
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+import numpy as np
 from ..models.game import GameState, LetterStatus
 from ..config.game_settings import WORD_LIST, MAX_ROUNDS
+from .game_store import InMemoryGameStore, RedisGameStore
+
+# Integer letter status codes, ordered so a higher code always wins
+_UNUSED, _MISS, _PRESENT, _HIT = 0, 1, 2, 3
+_STATUSES = (LetterStatus.UNUSED, LetterStatus.MISS, LetterStatus.PRESENT, LetterStatus.HIT)
+_STATUS_NAMES = tuple(status.value for status in _STATUSES)
+_ALL_HIT = bytes((_HIT,) * 5)
+
+# Absurdle patterns as base-3 numbers: digit per position is 0=MISS, 1=PRESENT, 2=HIT
+_PATTERN_WEIGHTS = np.array([1, 3, 9, 27, 81], dtype=np.int16)
+_PATTERN_COUNT = 243
+_WIN_PATTERN = _PATTERN_COUNT - 1  # All five letters HIT
+
+# Guesses whose pattern rows against the whole word list are memoized
+_PATTERN_CACHE_SIZE = 1024  # ~4.5 MB of int16 rows for the current word list
+
+# Client state dicts kept for the most recently read games
+_STATE_CACHE_SIZE = 4096
+
+# Lifetime counters reported by the health endpoint
+_COUNTER_NAMES = ("games_created_total", "games_completed_total", "games_won_total")
+
+# Matches a normalized guess made of exactly five letters A-Z
+_is_five_letters = re.compile(r'[A-Z]{5}').fullmatch
+
+
+def _letter_counts(word: str) -> List[int]:
+    """Counts how often each letter A-Z occurs in an uppercase word."""
+    counts = [0] * 26
+    for letter in word:
+        counts[ord(letter) - 65] += 1
+    return counts
+
+
+def _letter_status_dict(letter_status: bytearray) -> Dict[str, str]:
+    """Expands a 26-slot letter status code array into the client's {letter: status} dict."""
+    return dict(zip(string.ascii_uppercase, map(_STATUS_NAMES.__getitem__, letter_status)))
+
+
+def _guess_results(guesses: List[str], guess_codes: List[bytes]) -> List[List[Tuple[str, str]]]:
+    """Expands stored per-guess status codes into [(letter, status), ...] lists."""
+    return [list(zip(guess, map(_STATUS_NAMES.__getitem__, codes)))
+            for guess, codes in zip(guesses, guess_codes)]
+
+
+def _player_state_dict(player_state: Dict) -> Dict:
+    """Returns a serializable copy of a multiplayer player state."""
+    state = {key: value for key, value in player_state.items() if key != "guess_codes"}
+    state["guess_results"] = _guess_results(player_state["guesses"], player_state["guess_codes"])
+    state["letter_status"] = _letter_status_dict(player_state["letter_status"])
+    return state
+
+
+def _set_finished(game: Dict, player_state: Dict) -> None:
+    """Marks a multiplayer player as finished, counting each player only once."""
+    if not player_state["finished"]:
+        player_state["finished"] = True
+        game["finished_count"] += 1
+
+
+def _evaluate_codes(guess: str, target: str, target_counts: Optional[List[int]] = None) -> bytearray:
+    """
+    Evaluates a 5-letter uppercase guess against a target as status codes,
+    following the authentic Wordle letter evaluation algorithm.
+    
+    Uses a 26-slot count of the target's letters: exact matches consume their
+    letter first, then the remaining guess letters take PRESENT left to right
+    while unmatched copies of that letter are left.
+    
+    Args:
+        guess: Uppercase 5-letter guess
+        target: Uppercase 5-letter target word
+        target_counts: Precomputed _letter_counts(target), if available
+    
+    Returns:
+        bytearray of 5 codes (_MISS, _PRESENT or _HIT)
+    """
+    # Winning guess: every letter is a HIT, no need to count letters
+    if guess == target:
+        return bytearray(_ALL_HIT)
+    
+    target_counts = list(target_counts) if target_counts is not None else _letter_counts(target)
+    
+    codes = bytearray(5)
+    
+    # First pass: exact position matches (HIT)
+    for i in range(5):
+        if guess[i] == target[i]:
+            codes[i] = _HIT
+            target_counts[ord(guess[i]) - 65] -= 1
+    
+    # Second pass: present letters (PRESENT) and misses (MISS)
+    for i in range(5):
+        if not codes[i]:
+            index = ord(guess[i]) - 65
+            if target_counts[index]:
+                target_counts[index] -= 1
+                codes[i] = _PRESENT
+            else:
+                codes[i] = _MISS
+    
+    return codes
+
+
+def _evaluate_patterns(guess: np.ndarray, candidates: np.ndarray) -> np.ndarray:
+    """
+    Evaluates one guess against many candidate words at once.
+    
+    Same rules as _evaluate_codes: a non-HIT guess letter is PRESENT while
+    the candidate has more unmatched copies of it than earlier non-HIT guess
+    positions with the same letter have already claimed.
+    
+    Args:
+        guess: (5,) uint8 ASCII codes of the uppercase guess
+        candidates: (N, 5) uint8 ASCII codes of the candidate words
+    
+    Returns:
+        (N,) int16 array of base-3 patterns (0 is all MISS, _WIN_PATTERN all HIT)
+    """
+    hit = candidates == guess
+    unmatched = ~hit
+    
+    # available[n, i]: unmatched copies of guess[i] in candidate n
+    available = ((candidates[:, None, :] == guess[:, None]) & unmatched[:, None, :]).sum(axis=2)
+    
+    # claimed[n, i]: earlier unmatched guess positions with the same letter as guess[i]
+    earlier_same = np.tril(guess[:, None] == guess, k=-1)
+    claimed = unmatched.astype(np.int16) @ earlier_same.T
+    
+    present = unmatched & (available > claimed)
+    return (hit * 2 + present).astype(np.int16) @ _PATTERN_WEIGHTS
+
+
+def _pattern_codes(pattern: int) -> bytes:
+    """Converts a base-3 pattern back into 5 status codes."""
+    return bytes(pattern // 3 ** i % 3 + _MISS for i in range(5))
 
 
 class GameService:
@@ -21,11 +163,30 @@ class GameService:
     - Word selection and secure answer storage
     - Guess validation and evaluation
     - Game state management without exposing answers to clients
+    
+    Game data lives in a pluggable store (in-memory by default, Redis when
+    configured). Methods that change a game hold store.lock(game_id) while
+    they read, modify and write it back with _save_game(), so concurrent
+    requests for the same game cannot lose updates. Every save bumps the
+    game's version, which keys the cache of built client state.
     """
     
-    def __init__(self):
-        self.games: Dict[str, Dict] = {}  # Store active games by game_id
-        self.word_list = WORD_LIST.copy()
+    def __init__(self, store=None):
+        self.store = store if store is not None else InMemoryGameStore()  # Active games by game_id
+        self.word_list = WORD_LIST  # Immutable tuple, shared rather than copied
+        self.word_set = frozenset(WORD_LIST)  # O(1) membership checks for guess validation
+        # (N, 5) ASCII codes of the word list, for vectorized Absurdle evaluation
+        self.word_codes = np.frombuffer("".join(self.word_list).encode("ascii"), dtype=np.uint8).reshape(-1, 5)
+        # Starting Absurdle candidate set, shared read-only by new games (guesses
+        # replace a game's candidate array, never modify it). The smallest
+        # unsigned type that fits every index: uint16 for the current word list.
+        index_dtype = np.min_scalar_type(max(len(self.word_list) - 1, 0))
+        self._all_word_indices = np.arange(len(self.word_list), dtype=index_dtype)
+        self._all_word_indices.setflags(write=False)
+        self._word_list_patterns = functools.lru_cache(maxsize=_PATTERN_CACHE_SIZE)(self._evaluate_word_list)
+        self._state_cache: "OrderedDict[str, Tuple[int, Dict]]" = OrderedDict()  # game_id -> (version, state)
+        self._state_cache_lock = threading.Lock()
+        self._rng = random.SystemRandom()  # OS entropy, so target words cannot be predicted
     
     def create_new_game(self, game_mode: str = "wordle") -> str:
         """
@@ -37,34 +198,78 @@ class GameService:
         Returns:
             str: Unique game ID for this session
         """
-        game_id = str(uuid.uuid4())
+        game_id = secrets.token_urlsafe(12)  # 96 random bits, 16 URL-safe characters
         max_rounds = MAX_ROUNDS
         
         # Select random word (server keeps this secret)
-        target_word = random.choice(self.word_list)
+        target_word = self._rng.choice(self.word_list)
         
         # Initialize game state
         game_data = {
             "target_word": target_word if game_mode in ["wordle", "multiplayer"] else None,
+            "target_counts": _letter_counts(target_word) if game_mode in ["wordle", "multiplayer"] else None,
             "current_round": 0,
             "max_rounds": max_rounds if game_mode in ["wordle", "multiplayer"] else 1,  # Start with 1 for Absurdle
             "game_over": False,
             "won": False,
             "guesses": [],
-            "guess_results": [],
-            "letter_status": {letter: LetterStatus.UNUSED.value for letter in "ABCDEFGHIJKLMNOPQRSTUVWXYZ"},
+            "guess_codes": [],  # 5 status codes (bytes) per guess; letters are in "guesses"
+            "letter_status": bytearray(26),  # Status code per letter A-Z, all UNUSED
             "game_mode": game_mode,
-            "candidate_words": self.word_list.copy() if game_mode == "absurdle" else [],
+            "candidate_indices": self._all_word_indices if game_mode == "absurdle" else None,  # Into word_list
             # Multiplayer specific fields
             "players": [] if game_mode == "multiplayer" else None,
             "player_states": {} if game_mode == "multiplayer" else None,
+            "opponent_of": {} if game_mode == "multiplayer" else None,  # user_id -> opponent's player info
+            "finished_count": 0 if game_mode == "multiplayer" else None,  # Players whose "finished" is set
             "winner": None if game_mode == "multiplayer" else None,
-            "game_status": "active" if game_mode == "multiplayer" else None  # "active", "finished", "draw"
+            "game_status": "active" if game_mode == "multiplayer" else None,  # "active", "finished", "draw"
+            "version": 0  # Bumped on every save
         }
         
-        self.games[game_id] = game_data
+        self._save_game(game_id, game_data)
+        self.store.incr("games_created_total")
         return game_id
     
+    def get_game(self, game_id: str) -> Optional[Dict]:
+        """
+        Returns the raw stored data for a game session.
+        
+        Args:
+            game_id: Unique game identifier
+            
+        Returns:
+            Game data dictionary or None if game not found
+        """
+        return self.store.get(game_id)
+    
+    def count_games(self) -> int:
+        """Returns the number of active game sessions."""
+        return self.store.count()
+    
+    def _save_game(self, game_id: str, game: Dict) -> None:
+        """Writes a changed game back to the store under a new version."""
+        game["version"] += 1
+        self.store.put(game_id, game)
+    
+    def get_stats(self) -> Dict[str, int]:
+        """Returns lifetime counts of created, completed and won games."""
+        counters = self.store.counters()
+        return {name: counters.get(name, 0) for name in _COUNTER_NAMES}
+    
+    def _record_game_over(self, game: Dict) -> None:
+        """
+        Counts a game that has just ended. A multiplayer game counts as won
+        when it has a winner, whether by guessing the word or by forfeit.
+        """
+        self.store.incr("games_completed_total")
+        if game["game_mode"] == "multiplayer":
+            won = game["winner"] is not None
+        else:
+            won = game["won"]
+        if won:
+            self.store.incr("games_won_total")
+    
     def get_game_state(self, game_id: str) -> Optional[GameState]:
         """
         Returns the current game state for a session (without revealing the answer).
@@ -75,33 +280,85 @@ class GameService:
         Returns:
             GameState object or None if game not found
         """
-        if game_id not in self.games:
+        game = self.store.get(game_id)
+        if game is None:
             return None
         
-        game = self.games[game_id]
+        return self._build_game_state(game_id, game)
+    
+    def get_game_state_dict(self, game_id: str) -> Optional[Dict]:
+        """
+        Returns the current game state as a plain dictionary, ready to be
+        JSON-encoded. Same fields as get_game_state() without building the
+        dataclass and converting it back with asdict().
         
+        Args:
+            game_id: Unique game identifier
+            
+        Returns:
+            Game state dictionary or None if game not found
+        """
+        game = self.store.get(game_id)
+        if game is None:
+            return None
+        
+        return self._cached_state_dict(game_id, game)
+    
+    def _build_game_state(self, game_id: str, game: Dict) -> GameState:
+        """Builds the client-facing GameState from stored game data."""
+        return GameState(**self._game_state_dict(game_id, game))
+    
+    def _cached_state_dict(self, game_id: str, game: Dict) -> Dict:
+        """
+        Returns the state dict for a game, reusing the one already built for
+        its current version. Clients polling an unchanged game skip
+        rebuilding the guess results and letter status.
+        """
+        version = game["version"]
+        with self._state_cache_lock:
+            cached = self._state_cache.get(game_id)
+            if cached is not None and cached[0] == version:
+                self._state_cache.move_to_end(game_id)
+                return cached[1]
+        
+        state = self._game_state_dict(game_id, game)
+        with self._state_cache_lock:
+            self._state_cache[game_id] = (version, state)
+            self._state_cache.move_to_end(game_id)
+            if len(self._state_cache) > _STATE_CACHE_SIZE:
+                self._state_cache.popitem(last=False)
+        return state
+    
+    def _game_state_dict(self, game_id: str, game: Dict) -> Dict:
+        """
+        Builds the client-facing state fields from stored game data.
+        
+        The containers are shared with the stored game rather than copied:
+        callers only serialize the state.
+        Guess result and letter status codes are expanded to their names here.
+        """
         # Create state object without exposing the answer unless game is over
         answer = None
         if game["game_over"]:
             if game["game_mode"] == "wordle":
                 answer = game["target_word"]
-            elif game["game_mode"] == "absurdle" and len(game["candidate_words"]) == 1:
-                answer = game["candidate_words"][0]
+            elif game["game_mode"] == "absurdle" and len(game["candidate_indices"]) == 1:
+                answer = self.word_list[game["candidate_indices"][0]]
         
-        return GameState(
-            game_id=game_id,
-            current_round=game["current_round"],
-            max_rounds=game["max_rounds"],
-            game_over=game["game_over"],
-            won=game["won"],
-            guesses=game["guesses"].copy(),
-            guess_results=game["guess_results"].copy(),
-            letter_status=game["letter_status"].copy(),
-            answer=answer,
-            game_mode=game["game_mode"]
-        )
+        return {
+            "game_id": game_id,
+            "current_round": game["current_round"],
+            "max_rounds": game["max_rounds"],
+            "game_over": game["game_over"],
+            "won": game["won"],
+            "guesses": game["guesses"],
+            "guess_results": _guess_results(game["guesses"], game["guess_codes"]),
+            "letter_status": _letter_status_dict(game["letter_status"]),
+            "answer": answer,
+            "game_mode": game["game_mode"]
+        }
     
-    def is_valid_guess(self, game_id: str, guess: str) -> Tuple[bool, str]:
+    def is_valid_guess(self, game_id: str, guess: str) -> Tuple[bool, str, Optional[str]]:
         """
         Validates a guess for a specific game session.
 
@@ -110,18 +367,24 @@ class GameService:
             guess: The word to validate
 
         Returns:
-            Tuple of (is_valid, error_message)
+            Tuple of (is_valid, error_message, normalized_guess); the normalized
+            (stripped, uppercase) guess is None if it could not be computed
         """
-        if game_id not in self.games:
-            return False, "Game not found"
+        game = self.store.get(game_id)
+        if game is None:
+            return False, "Game not found", None
 
-        game = self.games[game_id]
+        return self._validate_guess(game, guess)
 
+    def _validate_guess(self, game: Dict, guess: str) -> Tuple[bool, str, Optional[str]]:
+        """
+        Validates a guess against already loaded game data.
+        """
         if game["game_over"]:
-            return False, "Game is already over"
+            return False, "Game is already over", None
 
         if not guess or not isinstance(guess, str):
-            return False, "Guess must be a valid string"
+            return False, "Guess must be a valid string", None
 
         normalized_guess = guess.strip().upper()
 
@@ -130,60 +393,66 @@ class GameService:
         if normalized_guess in spells:
             # Validate spell usage for multiplayer games
             if game["game_mode"] == "multiplayer":
-                return True, ""
+                return True, "", normalized_guess
             else:
-                return False, "Spells are only available in multiplayer mode"
-
-        # Normal word validation
-        if len(normalized_guess) != 5:
-            return False, "Guess must be exactly 5 letters"
+                return False, "Spells are only available in multiplayer mode", normalized_guess
 
-        if not normalized_guess.isalpha():
-            return False, "Guess must contain only letters"
+        # Normal word validation; only a failed match needs the specific reason
+        if not _is_five_letters(normalized_guess):
+            if len(normalized_guess) != 5:
+                return False, "Guess must be exactly 5 letters", normalized_guess
+            return False, "Guess must contain only letters", normalized_guess
 
-        if normalized_guess not in self.word_list:
-            return False, "Word not in word list"
+        if normalized_guess not in self.word_set:
+            return False, "Word not in word list", normalized_guess
 
-        return True, ""
+        return True, "", normalized_guess
 
-    def make_guess(self, game_id: str, guess: str) -> Optional[GameState]:
+    def make_guess(self, game_id: str, guess: str) -> Tuple[Optional[Dict], Optional[str]]:
         """
-        Processes a guess and updates game state.
+        Validates and processes a guess, updating game state.
 
         Args:
             game_id: Unique game identifier
             guess: The 5-letter word guess
 
         Returns:
-            Updated GameState or None if invalid
+            Tuple of (updated game state dictionary, None), or (None, error_message)
+            if the game does not exist or the guess is invalid
         """
-        is_valid, error = self.is_valid_guess(game_id, guess)
-        if not is_valid:
-            return None
+        with self.store.lock(game_id):
+            return self._apply_guess(game_id, guess)
 
-        game = self.games[game_id]
-        normalized_guess = guess.strip().upper()
+    def _apply_guess(self, game_id: str, guess: str) -> Tuple[Optional[Dict], Optional[str]]:
+        """Applies a guess to a game; the caller holds the game's lock."""
+        game = self.store.get(game_id)
+        if game is None:
+            return None, "Game not found"
+
+        is_valid, error, normalized_guess = self._validate_guess(game, guess)
+        if not is_valid:
+            return None, error
 
         # Check if this is a spell cast
         spells = ["FLASH", "WRONG", "BLOCK"]
         if normalized_guess in spells:
             # Handle spell casting - don't count as a regular guess
-            return self.get_game_state(game_id)
+            return self._cached_state_dict(game_id, game), None
 
         # Handle different game modes
         if game["game_mode"] == "wordle":
             target_word = game["target_word"]
-            evaluations = self._evaluate_guess_against_target(normalized_guess, target_word)
+            codes = _evaluate_codes(normalized_guess, target_word, game.get("target_counts"))
         else:  # absurdle
-            evaluations = self._process_absurdle_guess(game, normalized_guess)
+            codes = self._process_absurdle_guess(game, normalized_guess)
 
         # Update game state
         game["current_round"] += 1
         game["guesses"].append(normalized_guess)
-        game["guess_results"].append([(letter, status.value) for letter, status in evaluations])
+        game["guess_codes"].append(bytes(codes))
 
         # Update letter status
-        self._update_letter_status(game["letter_status"], evaluations)
+        self._update_letter_status(game["letter_status"], normalized_guess, codes)
 
         # Check win condition based on game mode
         if game["game_mode"] == "wordle":
@@ -198,164 +467,133 @@ class GameService:
             game["max_rounds"] = game["current_round"] + 1
 
             # Check if only one candidate remains and it matches the guess
-            if len(game["candidate_words"]) == 1 and normalized_guess == game["candidate_words"][0]:
+            candidates = game["candidate_indices"]
+            if len(candidates) == 1 and normalized_guess == self.word_list[candidates[0]]:
                 game["won"] = True
                 game["game_over"] = True
-            elif len(game["candidate_words"]) == 0:
+            elif len(candidates) == 0:
                 # Shouldn't happen in well-implemented Absurdle
                 game["game_over"] = True
 
-        return self.get_game_state(game_id)
+        if game["game_over"]:
+            self._record_game_over(game)
 
-    def _evaluate_guess_against_target(self, guess: str, target: str) -> List[Tuple[str, LetterStatus]]:
-        """
-        Implements the authentic Wordle letter evaluation algorithm.
-        """
-        result: List[Tuple[str, Optional[LetterStatus]]] = []
-        
-        # Create working copies to track letter consumption
-        target_chars = list(target)
-        guess_chars = list(guess)
-        
-        # First pass: Mark all exact position matches (HIT)
-        for i in range(5):
-            if guess_chars[i] == target_chars[i]:
-                result.append((guess_chars[i], LetterStatus.HIT))
-                # Mark as consumed to prevent double-counting
-                target_chars[i] = None  # type: ignore
-                guess_chars[i] = None   # type: ignore
-            else:
-                result.append((guess_chars[i], None))  # Placeholder for second pass
-        
-        # Second pass: Mark present letters (PRESENT) and misses (MISS)
-        for i in range(5):
-            if result[i][1] is None:  # Not already marked as HIT
-                letter = guess[i]
-                
-                # Check if letter exists in remaining target characters
-                if letter in target_chars:
-                    result[i] = (letter, LetterStatus.PRESENT)
-                    # Remove first occurrence to prevent double-counting
-                    target_chars[target_chars.index(letter)] = None  # type: ignore
-                else:
-                    result[i] = (letter, LetterStatus.MISS)
-        
-        # Type assertion: all placeholders should be resolved
-        return [(letter, status) for letter, status in result if status is not None]
+        self._save_game(game_id, game)
+        return self._cached_state_dict(game_id, game), None
 
-    def _update_letter_status(self, letter_status: Dict[str, str], evaluations: List[Tuple[str, LetterStatus]]) -> None:
+    def _update_letter_status(self, letter_status: bytearray, guess: str, codes: bytes) -> None:
         """
         Updates global letter status tracking based on guess results.
+        
+        Status can only progress in priority order, and the codes are ordered
+        by priority (UNUSED < MISS < PRESENT < HIT), so each letter keeps the
+        highest code it has seen.
         """
-        for letter, new_status in evaluations:
-            current_status = LetterStatus(letter_status[letter])
-            
-            # Status can only progress in priority order
-            if new_status == LetterStatus.HIT:
-                letter_status[letter] = LetterStatus.HIT.value
-            elif new_status == LetterStatus.PRESENT and current_status != LetterStatus.HIT:
-                letter_status[letter] = LetterStatus.PRESENT.value
-            elif new_status == LetterStatus.MISS and current_status == LetterStatus.UNUSED:
-                letter_status[letter] = LetterStatus.MISS.value
-
-    def _process_absurdle_guess(self, game: Dict, guess: str) -> List[Tuple[str, LetterStatus]]:
+        for i in range(5):
+            index = ord(guess[i]) - 65
+            letter_status[index] = max(letter_status[index], codes[i])
+
+    def _process_absurdle_guess(self, game: Dict, guess: str) -> bytes:
         """
         Process a guess in Absurdle mode by finding the worst possible feedback.
-        """
-        candidate_words = game["candidate_words"]
-        
-        # Group candidate words by the patterns they actually produce
-        pattern_groups = {}
         
-        for word in candidate_words:
-            # Calculate the actual pattern this word would produce
-            pattern = self._evaluate_guess_against_target(guess, word)
-            pattern_key = self._pattern_to_key(pattern)
-            
-            # Add to pattern group
-            if pattern_key not in pattern_groups:
-                pattern_groups[pattern_key] = {
-                    'pattern': pattern,
-                    'words': []
-                }
-            pattern_groups[pattern_key]['words'].append(word)
+        All candidates are evaluated at once with NumPy and grouped by the
+        pattern the guess produces against them; the largest group that is
+        not a win survives as the new candidate set. Ties go to the pattern
+        whose first word comes earliest in the candidate order.
         
-        # All groups are valid since they come from actual words
-        valid_groups = list(pattern_groups.values())
-        
-        if not valid_groups:
+        Returns:
+            The 5 status codes of the chosen pattern
+        """
+        candidates = game["candidate_indices"]
+        if len(candidates) == 0:
             # Fallback - shouldn't happen
-            return [(letter, LetterStatus.MISS) for letter in guess]
-        
-        # Find the group with maximum words (worst case for player)
-        # First, separate winning and non-winning groups
-        winning_groups = []
-        non_winning_groups = []
+            return bytes((_MISS,) * 5)
         
-        for group in valid_groups:
-            is_win_group = all(status == LetterStatus.HIT for _, status in group['pattern'])
-            if is_win_group:
-                winning_groups.append(group)
-            else:
-                non_winning_groups.append(group)
+        if len(candidates) == 1:
+            # The outcome is fixed: evaluate against the last word directly
+            return bytes(_evaluate_codes(guess, self.word_list[candidates[0]]))
         
-        # Choose from non-winning groups first (if any exist)
-        if non_winning_groups:
-            # Find the non-winning group with maximum words
-            chosen_group = max(non_winning_groups, key=lambda g: len(g['words']))
+        if len(candidates) * 8 >= len(self.word_list):
+            # Large candidate sets (first guesses above all) reuse the memoized
+            # row for this guess; small ones are cheaper to evaluate directly
+            patterns = self._word_list_patterns(guess)[candidates]
         else:
-            # Only winning groups exist, choose the one with maximum words
-            chosen_group = max(winning_groups, key=lambda g: len(g['words']))
+            guess_codes = np.frombuffer(guess.encode("ascii"), dtype=np.uint8)
+            patterns = _evaluate_patterns(guess_codes, self.word_codes[candidates])
+        group_sizes = np.bincount(patterns, minlength=_PATTERN_COUNT)
+        
+        # Choose from non-winning groups first (if any exist), keeping the
+        # one with maximum words (worst case for player)
+        if group_sizes[_WIN_PATTERN] < len(candidates):
+            group_sizes[_WIN_PATTERN] = 0
+        largest = np.flatnonzero(group_sizes == group_sizes.max())
+        if len(largest) == 1:
+            chosen_pattern = int(largest[0])
+        else:
+            chosen_pattern = int(patterns[np.isin(patterns, largest).argmax()])
         
         # Update candidate words
-        game["candidate_words"] = chosen_group['words']
+        game["candidate_indices"] = candidates[patterns == chosen_pattern]
         
-        return chosen_group['pattern']
+        return _pattern_codes(chosen_pattern)
 
-    def _pattern_to_key(self, pattern: List[Tuple[str, LetterStatus]]) -> str:
-        """
-        Convert a pattern to a string key for comparison.
-        """
-        return ''.join([f"{letter}:{status.value}" for letter, status in pattern])
+    def _evaluate_word_list(self, guess: str) -> np.ndarray:
+        """Base-3 patterns of a guess against every word in the word list (read-only)."""
+        guess_codes = np.frombuffer(guess.encode("ascii"), dtype=np.uint8)
+        patterns = _evaluate_patterns(guess_codes, self.word_codes)
+        patterns.setflags(write=False)  # Shared by every game that makes this guess
+        return patterns
 
     def add_player_to_multiplayer_game(self, game_id: str, user_id: str, username: str) -> bool:
         """Add a player to a multiplayer game."""
-        if game_id not in self.games:
-            return False
-        
-        game_data = self.games[game_id]
-        if game_data["game_mode"] != "multiplayer":
-            return False
-        
-        # Initialize player state
-        player_info = {"id": user_id, "username": username}
-        if player_info not in game_data["players"]:
-            game_data["players"].append(player_info)
-            game_data["player_states"][user_id] = {
-                "current_round": 0,
-                "guesses": [],
-                "guess_results": [],
-                "letter_status": {letter: LetterStatus.UNUSED.value for letter in "ABCDEFGHIJKLMNOPQRSTUVWXYZ"},
-                "game_over": False,
-                "won": False,
-                "finished": False
-            }
-        return True
+        with self.store.lock(game_id):
+            game_data = self.store.get(game_id)
+            if game_data is None:
+                return False
+        
+            if game_data["game_mode"] != "multiplayer":
+                return False
+        
+            # Initialize player state
+            player_info = {"id": user_id, "username": username}
+            if player_info not in game_data["players"]:
+                game_data["players"].append(player_info)
+                game_data["player_states"][user_id] = {
+                    "current_round": 0,
+                    "guesses": [],
+                    "guess_codes": [],
+                    "letter_status": bytearray(26),
+                    "game_over": False,
+                    "won": False,
+                    "finished": False
+                }
+                if len(game_data["players"]) == 2:
+                    first, second = game_data["players"]
+                    game_data["opponent_of"] = {first["id"]: second, second["id"]: first}
+                self._save_game(game_id, game_data)
+                self.store.add_user_game(user_id, game_id)  # Until the game ends
+            return True
 
     def make_multiplayer_guess(self, game_id: str, user_id: str, guess: str) -> Optional[Dict]:
         """Process a guess in multiplayer mode."""
-        if game_id not in self.games:
+        with self.store.lock(game_id):
+            return self._apply_multiplayer_guess(game_id, user_id, guess)
+
+    def _apply_multiplayer_guess(self, game_id: str, user_id: str, guess: str) -> Optional[Dict]:
+        """Applies a multiplayer guess; the caller holds the game's lock."""
+        game_data = self.store.get(game_id)
+        if game_data is None:
             return None
 
-        game_data = self.games[game_id]
         if game_data["game_mode"] != "multiplayer":
             return None
 
-        if user_id not in game_data["player_states"]:
+        player_states = game_data["player_states"]
+        player_state = player_states.get(user_id)
+        if player_state is None:
             return None
 
-        player_state = game_data["player_states"][user_id]
-
         # Check if player already finished
         if player_state["finished"]:
             return None
@@ -365,7 +603,7 @@ class GameService:
             return None
 
         # Validate guess using the same method as regular Wordle
-        is_valid, error_message = self.is_valid_guess(game_id, guess)
+        is_valid, error_message, guess = self._validate_guess(game_data, guess)
         if not is_valid:
             return {"error": error_message}
 
@@ -377,35 +615,28 @@ class GameService:
                 "spell_cast": True,
                 "spell": guess,
                 "caster_id": user_id,
-                "player_state": player_state,
+                "player_state": _player_state_dict(player_state),
                 "game_status": game_data["game_status"],
                 "game_over": game_data["game_over"]
             }
 
         # Process guess
         target_word = game_data["target_word"]
-        result = self._evaluate_guess_against_target(guess, target_word)
+        codes = _evaluate_codes(guess, target_word, game_data.get("target_counts"))
 
         # Update player state
         player_state["current_round"] += 1
         player_state["guesses"].append(guess)
-        player_state["guess_results"].append([(letter, status.value) for letter, status in result])
+        player_state["guess_codes"].append(bytes(codes))
 
         # Update letter status for this player
-        for letter, status in result:
-            current_status = LetterStatus(player_state["letter_status"][letter])
-            new_status = status  # status is already a LetterStatus enum
-
-            if current_status == LetterStatus.UNUSED or \
-               (current_status == LetterStatus.MISS and new_status in [LetterStatus.PRESENT, LetterStatus.HIT]) or \
-               (current_status == LetterStatus.PRESENT and new_status == LetterStatus.HIT):
-                player_state["letter_status"][letter] = status.value
+        self._update_letter_status(player_state["letter_status"], guess, codes)
 
         # Check if player won
         if guess == target_word:
             player_state["won"] = True
             player_state["game_over"] = True
-            player_state["finished"] = True
+            _set_finished(game_data, player_state)
             game_data["winner"] = user_id
             game_data["game_status"] = "finished"
             game_data["game_over"] = True
@@ -414,20 +645,21 @@ class GameService:
         # Check if player used all attempts
         elif player_state["current_round"] >= game_data["max_rounds"]:
             player_state["game_over"] = True
-            player_state["finished"] = True
+            _set_finished(game_data, player_state)
 
             # Check if both players finished
-            all_finished = all(
-                game_data["player_states"][pid]["finished"]
-                for pid in game_data["player_states"]
-            )
-
-            if all_finished and game_data["winner"] is None:
+            if game_data["finished_count"] == len(player_states) and game_data["winner"] is None:
                 game_data["game_status"] = "draw"
                 game_data["game_over"] = True
 
+        if game_data["game_over"]:
+            self._record_game_over(game_data)
+            self._unindex_game(game_id, player_states)
+
+        self._save_game(game_id, game_data)
+
         return {
-            "player_state": player_state,
+            "player_state": _player_state_dict(player_state),
             "game_status": game_data["game_status"],
             "winner": game_data["winner"],
             "game_over": game_data["game_over"],
@@ -436,29 +668,29 @@ class GameService:
 
     def get_multiplayer_game_state(self, game_id: str, user_id: str) -> Optional[Dict]:
         """Get multiplayer game state for a specific player."""
-        if game_id not in self.games:
+        game_data = self.store.get(game_id)
+        if game_data is None:
             return None
         
-        game_data = self.games[game_id]
         if game_data["game_mode"] != "multiplayer":
             return None
         
-        if user_id not in game_data["player_states"]:
+        player_states = game_data["player_states"]
+        player_state = player_states.get(user_id)
+        if player_state is None:
             return None
         
-        player_state = game_data["player_states"][user_id]
-        
         # Get opponent info
         opponent = None
-        for player in game_data["players"]:
-            if player["id"] != user_id:
-                opponent = {
-                    "username": player["username"],
-                    "current_round": game_data["player_states"][player["id"]]["current_round"],
-                    "finished": game_data["player_states"][player["id"]]["finished"],
-                    "won": game_data["player_states"][player["id"]]["won"]
-                }
-                break
+        opponent_info = game_data["opponent_of"].get(user_id)
+        if opponent_info is not None:
+            opponent_state = player_states[opponent_info["id"]]
+            opponent = {
+                "username": opponent_info["username"],
+                "current_round": opponent_state["current_round"],
+                "finished": opponent_state["finished"],
+                "won": opponent_state["won"]
+            }
         
         return {
             "game_id": game_id,
@@ -471,8 +703,8 @@ class GameService:
             "player": {
                 "current_round": player_state["current_round"],
                 "guesses": player_state["guesses"],
-                "guess_results": player_state["guess_results"],
-                "letter_status": player_state["letter_status"],
+                "guess_results": _guess_results(player_state["guesses"], player_state["guess_codes"]),
+                "letter_status": _letter_status_dict(player_state["letter_status"]),
                 "game_over": player_state["game_over"],
                 "won": player_state["won"],
                 "finished": player_state["finished"]
@@ -496,54 +728,67 @@ class GameService:
         games_affected = 0
         affected_game_ids = []
         
-        # Find all multiplayer games where this user is a player
-        for game_id, game_data in self.games.items():
-            if (game_data.get("game_mode") == "multiplayer" and 
-                user_id in game_data.get("player_states", {})):
+        # Find all unfinished multiplayer games where this user is a player
+        game_ids = self.store.user_games(user_id)
+        
+        for game_id in game_ids:
+            with self.store.lock(game_id):
+                # Read under the lock; a guess may have ended the game meanwhile
+                game_data = self.store.get(game_id)
+                if game_data is None:
+                    # Expired from the store
+                    self._unindex_game(game_id, [user_id])
+                    continue
+                if game_data["game_status"] != "active" or game_data["game_over"]:
+                    continue
                 
-                # Check if game is still active
-                if game_data.get("game_status") == "active" and not game_data.get("game_over"):
-                    games_affected += 1
-                    affected_game_ids.append(game_id)
-                    
-                    # Mark the disconnected player as forfeited
-                    player_state = game_data["player_states"][user_id]
-                    player_state["finished"] = True
-                    player_state["game_over"] = True
-                    player_state["won"] = False
-                    
-                    # Find opponent and declare them winner (if they haven't also disconnected)
-                    opponent_id = None
-                    opponent_won = False
-                    
-                    for pid in game_data["player_states"]:
-                        if pid != user_id:
-                            opponent_id = pid
-                            opponent_state = game_data["player_states"][pid]
-                            
-                            # Only declare opponent winner if they're still connected/active
-                            if not opponent_state.get("finished", False):
-                                opponent_state["won"] = True
-                                opponent_state["finished"] = True
-                                opponent_state["game_over"] = True
-                                game_data["winner"] = opponent_id
-                                opponent_won = True
-                            break
-                    
-                    # Mark game as finished
-                    game_data["game_status"] = "finished" if opponent_won else "abandoned"
-                    game_data["game_over"] = True
-                    
-                    print(f"Game {game_id}: {username} forfeited due to disconnect")
-        
+                games_affected += 1
+                affected_game_ids.append(game_id)
+            
+                # Mark the disconnected player as forfeited
+                player_states = game_data["player_states"]
+                player_state = player_states[user_id]
+                _set_finished(game_data, player_state)
+                player_state["game_over"] = True
+                player_state["won"] = False
+            
+                # Find opponent and declare them winner (if they haven't also disconnected)
+                opponent_won = False
+                opponent_info = game_data["opponent_of"].get(user_id)
+            
+                if opponent_info is not None:
+                    opponent_id = opponent_info["id"]
+                    opponent_state = player_states[opponent_id]
+                
+                    # Only declare opponent winner if they're still connected/active
+                    if not opponent_state.get("finished", False):
+                        opponent_state["won"] = True
+                        _set_finished(game_data, opponent_state)
+                        opponent_state["game_over"] = True
+                        game_data["winner"] = opponent_id
+                        opponent_won = True
+            
+                # Mark game as finished
+                game_data["game_status"] = "finished" if opponent_won else "abandoned"
+                game_data["game_over"] = True
+                self._record_game_over(game_data)
+                self._unindex_game(game_id, player_states)
+                self._save_game(game_id, game_data)
+            
+                print(f"Game {game_id}: {username} forfeited due to disconnect")
+
         return {
             "games_affected": games_affected,
             "affected_game_ids": affected_game_ids
         }
 
+    def _unindex_game(self, game_id: str, user_ids: Iterable[str]) -> None:
+        """Removes a finished or vanished multiplayer game from its players' index entries."""
+        self.store.remove_user_game(game_id, list(user_ids))
+
     def delete_game(self, game_id: str) -> bool:
         """
-        Removes a completed game session from memory.
+        Removes a completed game session from the store.
         
         Args:
             game_id: Unique game identifier
@@ -551,10 +796,14 @@ class GameService:
         Returns:
             bool: True if game was deleted, False if not found
         """
-        if game_id in self.games:
-            del self.games[game_id]
-            return True
-        return False
+        # Wait for an in-flight guess on this game rather than racing its save
+        with self.store.lock(game_id):
+            game = self.store.get(game_id)
+            if game is not None and game["game_mode"] == "multiplayer":
+                self._unindex_game(game_id, game["player_states"])
+            with self._state_cache_lock:
+                self._state_cache.pop(game_id, None)
+            return self.store.delete(game_id)
 
 
 # Global service instance
@@ -566,8 +815,17 @@ def get_game_service() -> Optional[GameService]:
     return _game_service
 
 
-def initialize_game_service() -> GameService:
-    """Initialize the global game service instance."""
+def initialize_game_service(redis_url: Optional[str] = None, game_ttl_seconds: int = 3600) -> GameService:
+    """
+    Initialize the global game service instance.
+    
+    Args:
+        redis_url: Optional Redis URL; games are kept in memory when not set
+        game_ttl_seconds: Seconds an idle game is kept in Redis
+    """
     global _game_service
-    _game_service = GameService()
+    store = None
+    if redis_url:
+        store = RedisGameStore(redis_url, game_ttl_seconds)
+    _game_service = GameService(store)
     return _game_service
\ No newline at end of file
@@ -0,0 +1,235 @@
+"""
+Game Store
+
+Storage backends for active game sessions. The in-memory store keeps games in
+this process; the Redis store lets game state survive restarts and be shared
+between server processes.
+"""
+
+import threading
+import time
+import weakref
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+import numpy as np
+import orjson
+
+
+# Tags for the binary values in game data, which JSON has no type for
+_BYTES_TAG = "__bytes__"
+_BYTEARRAY_TAG = "__bytearray__"
+_NDARRAY_TAG = "__ndarray__"
+
+
+def _encode_value(value: Any) -> Dict[str, Any]:
+    """orjson default hook: tags bytes, bytearray and NumPy arrays as hex strings."""
+    if isinstance(value, bytearray):
+        return {_BYTEARRAY_TAG: value.hex()}
+    if isinstance(value, bytes):
+        return {_BYTES_TAG: value.hex()}
+    if isinstance(value, np.ndarray):
+        return {_NDARRAY_TAG: [value.dtype.str, value.tobytes().hex()]}
+    raise TypeError(f"Cannot store value of type {type(value).__name__}")
+
+
+def _decode_value(value: Any) -> Any:
+    """Restores the values tagged by _encode_value in decoded JSON."""
+    if isinstance(value, dict):
+        if len(value) == 1:
+            if _BYTES_TAG in value:
+                return bytes.fromhex(value[_BYTES_TAG])
+            if _BYTEARRAY_TAG in value:
+                return bytearray.fromhex(value[_BYTEARRAY_TAG])
+            if _NDARRAY_TAG in value:
+                dtype, data = value[_NDARRAY_TAG]
+                return np.frombuffer(bytes.fromhex(data), dtype=dtype)
+        return {key: _decode_value(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_decode_value(item) for item in value]
+    return value
+
+
+class _GameLock:
+    """Mutex for one game; a plain class so it can be held weakly."""
+
+    __slots__ = ("_lock", "__weakref__")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        self._lock.acquire()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._lock.release()
+
+
+class InMemoryGameStore:
+    """Game store backed by a dict in the current process."""
+
+    def __init__(self):
+        self._games: Dict[str, Dict] = {}
+        # Locks disappear once no request holds or waits on them
+        self._locks = weakref.WeakValueDictionary()
+        self._locks_guard = threading.Lock()
+        self._counters: Dict[str, int] = {}
+        self._user_games: Dict[str, Set[str]] = {}  # user_id -> game_ids
+
+    def get(self, game_id: str) -> Optional[Dict]:
+        """Return the game data for game_id, or None if it does not exist."""
+        return self._games.get(game_id)
+
+    def put(self, game_id: str, game_data: Dict) -> None:
+        """Create or replace the game data for game_id."""
+        self._games[game_id] = game_data
+
+    def delete(self, game_id: str) -> bool:
+        """Remove a game. Returns True if it existed."""
+        return self._games.pop(game_id, None) is not None
+
+    def count(self) -> int:
+        """Number of stored games."""
+        return len(self._games)
+
+    def lock(self, game_id: str) -> _GameLock:
+        """Return the lock that serializes read-modify-write updates of game_id."""
+        with self._locks_guard:
+            lock = self._locks.get(game_id)
+            if lock is None:
+                lock = self._locks[game_id] = _GameLock()
+            return lock
+
+    def add_user_game(self, user_id: str, game_id: str) -> None:
+        """Index game_id under a player so it can be found by user."""
+        with self._locks_guard:
+            self._user_games.setdefault(user_id, set()).add(game_id)
+
+    def remove_user_game(self, game_id: str, user_ids: Iterable[str]) -> None:
+        """Remove game_id from the index entries of the given players."""
+        with self._locks_guard:
+            for user_id in user_ids:
+                game_ids = self._user_games.get(user_id)
+                if game_ids is not None:
+                    game_ids.discard(game_id)
+                    if not game_ids:
+                        del self._user_games[user_id]
+
+    def user_games(self, user_id: str) -> List[str]:
+        """game_ids indexed under a player."""
+        with self._locks_guard:
+            return list(self._user_games.get(user_id, ()))
+
+    def incr(self, name: str, amount: int = 1) -> None:
+        """Increment a lifetime statistics counter."""
+        with self._locks_guard:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    def counters(self) -> Dict[str, int]:
+        """Current values of all statistics counters."""
+        return dict(self._counters)
+
+
+class RedisGameStore:
+    """
+    Game store backed by Redis.
+
+    Each game is stored as JSON under ``game:<game_id>`` with a TTL so
+    abandoned sessions expire on their own. Bytes and NumPy arrays are
+    stored as tagged hex strings; nothing read back from Redis is unpickled,
+    so write access to Redis does not mean code execution on the server.
+    A sorted set scored by expiry time indexes the live games so they can be
+    counted without SCAN; expired entries are pruned on every
+    write. Per-player sets ``user:<user_id>:games`` index the games a user
+    plays in, so every process sharing the Redis can find them.
+    """
+
+    KEY_PREFIX = "game:"
+    INDEX_KEY = "games:index"
+    STATS_KEY = "games:stats"
+    USER_GAMES_KEY = "user:{}:games"
+    LOCK_TIMEOUT = 5  # Seconds a game lock is held at most, and waited for at most
+
+    def __init__(self, redis_url: str, ttl_seconds: int = 3600):
+        """
+        Connect to Redis.
+
+        Args:
+            redis_url: Redis connection URL, e.g. redis://localhost:6379/0
+            ttl_seconds: Seconds a game is kept after its last update
+        """
+        import redis  # Only required when a Redis URL is configured
+
+        self.client = redis.Redis.from_url(redis_url)
+        self.ttl_seconds = ttl_seconds
+
+    def _key(self, game_id: str) -> str:
+        return f"{self.KEY_PREFIX}{game_id}"
+
+    def get(self, game_id: str) -> Optional[Dict]:
+        """Return the game data for game_id, or None if it does not exist."""
+        raw = self.client.get(self._key(game_id))
+        if raw is None:
+            return None
+        try:
+            return _decode_value(orjson.loads(raw))
+        except orjson.JSONDecodeError:
+            # Not JSON, e.g. written in an older format: treat as gone until it expires
+            return None
+
+    def put(self, game_id: str, game_data: Dict) -> None:
+        """Create or replace the game data for game_id and refresh its TTL."""
+        now = time.time()
+        pipe = self.client.pipeline()
+        pipe.set(self._key(game_id), orjson.dumps(game_data, default=_encode_value), ex=self.ttl_seconds)
+        pipe.zadd(self.INDEX_KEY, {game_id: now + self.ttl_seconds})
+        pipe.zremrangebyscore(self.INDEX_KEY, "-inf", now)
+        pipe.execute()
+
+    def delete(self, game_id: str) -> bool:
+        """Remove a game. Returns True if it existed."""
+        pipe = self.client.pipeline()
+        pipe.delete(self._key(game_id))
+        pipe.zrem(self.INDEX_KEY, game_id)
+        deleted, _ = pipe.execute()
+        return deleted > 0
+
+    def count(self) -> int:
+        """Number of live games."""
+        return self.client.zcount(self.INDEX_KEY, time.time(), "+inf")
+
+    def add_user_game(self, user_id: str, game_id: str) -> None:
+        """Index game_id under a player; the set expires with the player's latest game."""
+        key = self.USER_GAMES_KEY.format(user_id)
+        pipe = self.client.pipeline()
+        pipe.sadd(key, game_id)
+        pipe.expire(key, self.ttl_seconds)
+        pipe.execute()
+
+    def remove_user_game(self, game_id: str, user_ids: Iterable[str]) -> None:
+        """Remove game_id from the index entries of the given players."""
+        pipe = self.client.pipeline()
+        for user_id in user_ids:
+            pipe.srem(self.USER_GAMES_KEY.format(user_id), game_id)
+        pipe.execute()
+
+    def user_games(self, user_id: str) -> List[str]:
+        """game_ids indexed under a player."""
+        return [raw_id.decode("utf-8") for raw_id in self.client.smembers(self.USER_GAMES_KEY.format(user_id))]
+
+    def incr(self, name: str, amount: int = 1) -> None:
+        """Increment a lifetime statistics counter shared by all processes."""
+        self.client.hincrby(self.STATS_KEY, name, amount)
+
+    def counters(self) -> Dict[str, int]:
+        """Current values of all statistics counters."""
+        return {name.decode("utf-8"): int(value) for name, value in self.client.hgetall(self.STATS_KEY).items()}
+
+    def lock(self, game_id: str):
+        """
+        Return a Redis lock that serializes read-modify-write updates of game_id
+        across processes. Entering it raises redis.exceptions.LockError if the
+        lock is not acquired within LOCK_TIMEOUT seconds.
+        """
+        return self.client.lock(f"{self._key(game_id)}:lock",
+                                timeout=self.LOCK_TIMEOUT, blocking_timeout=self.LOCK_TIMEOUT)
@@ -50,7 +50,7 @@ class LobbyService:
             return {'success': False, 'error': 'Room is full'}
         
         # Check if user is already in this room
-        if any(p['id'] == user_id for p in room['players']):
+        if self.user_to_room.get(user_id) == room_id:
             return {'success': False, 'error': 'Already in this room'}
         
         # Remove from current room if in one
@@ -100,7 +100,11 @@ class LobbyService:
         room = self.rooms[room_id]
         
         # Remove player from room
-        room['players'] = [p for p in room['players'] if p['id'] != user_id]
+        players = room['players']
+        for index, player in enumerate(players):
+            if player['id'] == user_id:
+                del players[index]
+                break
         del self.user_to_room[user_id]
         
         return {
@@ -5,14 +5,112 @@ This module provides comprehensive logging for user actions, server responses,
 and game events. Designed with future multiplayer support in mind.
 """
 
+import atexit
 import logging
 import json
 import os
+import queue
 from datetime import datetime
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
 from typing import Dict, Any, Optional
 from pathlib import Path
 
 
+# Records that may wait for the listener thread; beyond this new records are dropped
+LOG_QUEUE_SIZE = 20000
+
+# Seconds shutdown waits for the listener to drain the queue
+LOG_STOP_TIMEOUT = 5
+
+# Most records written to the log file in one batch; ERROR records are written at once
+LOG_FILE_BUFFER_RECORDS = 512
+
+
+class _DroppingQueueHandler(QueueHandler):
+    """
+    QueueHandler that drops and counts records when the queue is full (the
+    disk cannot keep up) rather than blocking the request thread.
+    """
+
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class _DrainingQueueListener(QueueListener):
+    """
+    QueueListener that flushes its handlers whenever it has drained the
+    queue, so buffered records reach the file as soon as logging goes quiet.
+    Stopping never blocks shutdown for more than about twice LOG_STOP_TIMEOUT,
+    even with a full queue or a listener thread that has died.
+    """
+
+    def handle(self, record):
+        super().handle(record)
+        if self.queue.empty():
+            for handler in self.handlers:
+                # An exception here would end the listener thread for good
+                try:
+                    handler.flush()
+                except Exception:
+                    handler.handleError(record)
+
+    def enqueue_sentinel(self):
+        if self._thread is None or not self._thread.is_alive():
+            return  # Nobody left to read it
+        try:
+            self.queue.put(self._sentinel, timeout=LOG_STOP_TIMEOUT)
+        except queue.Full:
+            # The listener is not keeping up: make room by dropping the oldest record
+            try:
+                self.queue.get_nowait()
+            except queue.Empty:
+                pass
+            self.queue.put_nowait(self._sentinel)
+
+    def stop(self):
+        if self._thread is not None:
+            self.enqueue_sentinel()
+            self._thread.join(LOG_STOP_TIMEOUT)
+            self._thread = None
+
+
+class _BatchHandler(MemoryHandler):
+    """
+    MemoryHandler that writes its buffered records to the target file in one
+    write. A failed write is reported through the target's handleError, like
+    FileHandler.emit does, and the batch is discarded rather than retried.
+    """
+
+    def flush(self):
+        self.acquire()
+        try:
+            if self.target and self.buffer:
+                target = self.target
+                try:
+                    text = ''.join(target.format(record) + target.terminator for record in self.buffer)
+                    target.acquire()
+                    try:
+                        if target.stream is None:
+                            target.stream = target._open()
+                        target.stream.write(text)
+                        target.flush()
+                    finally:
+                        target.release()
+                except Exception:
+                    target.handleError(self.buffer[-1])
+                finally:
+                    self.buffer.clear()
+        finally:
+            self.release()
+
+
 class GameLogger:
     """
     Centralized logging system for Wordle game server.
@@ -23,6 +121,13 @@ class GameLogger:
     - Game event logging
     - JSON structured logs for easy parsing
     - Future-ready for multiplayer features
+    
+    Records are handed to a bounded queue; a listener thread owns the file
+    and console handlers and does the formatting and disk writes, so callers
+    never wait on them. If the queue fills up, records are dropped and
+    counted in get_log_stats(). Records that arrive together are written
+    to the file in one batch once the queue is drained; an ERROR record
+    writes out the batch immediately.
     """
     
     def __init__(self, log_dir: str = "logs"):
@@ -33,7 +138,7 @@ class GameLogger:
         self.logger = self._setup_logger()
         
     def _setup_logger(self) -> logging.Logger:
-        """Setup the main game logger with file handler."""
+        """Setup the main game logger with a queue feeding the file and console handlers."""
         logger = logging.getLogger('wordle_game')
         logger.setLevel(logging.INFO)
         
@@ -66,8 +171,27 @@ class GameLogger:
         file_handler.setFormatter(file_formatter)
         console_handler.setFormatter(console_formatter)
         
-        logger.addHandler(file_handler)
-        logger.addHandler(console_handler)
+        # Write the file in batches instead of one write and flush per record
+        buffered_file_handler = _BatchHandler(
+            LOG_FILE_BUFFER_RECORDS,
+            flushLevel=logging.ERROR,
+            target=file_handler,
+            flushOnClose=True
+        )
+        buffered_file_handler.setLevel(logging.INFO)
+        
+        # Log calls only enqueue; the listener thread formats and writes
+        log_queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+        self.queue_handler = _DroppingQueueHandler(log_queue)
+        logger.addHandler(self.queue_handler)
+        self.listener = _DrainingQueueListener(log_queue, buffered_file_handler, console_handler, respect_handler_level=True)
+        self.listener.start()
+        
+        # Drain queued records, then write out the file buffer, before the interpreter exits
+        def stop_logging():
+            self.listener.stop()
+            buffered_file_handler.flush()
+        atexit.register(stop_logging)
         
         return logger
     
@@ -87,7 +211,13 @@ class GameLogger:
                          action: str, 
                          user_info: Dict[str, str],
                          details: Dict[str, Any]) -> str:
-        """Create a structured log entry."""
+        """
+        Create a structured log entry as a JSON string.
+        
+        Encoded in the calling thread, so the entry records the values at the
+        time of the call rather than whatever the referenced objects hold when
+        the listener thread gets to it.
+        """
         log_entry = {
             'timestamp': datetime.now().isoformat(),
             'event_type': event_type,
@@ -251,7 +381,8 @@ class GameLogger:
                 'user_actions': 0,
                 'server_responses': 0,
                 'game_events': 0,
-                'errors': 0
+                'errors': 0,
+                'dropped_records': self.queue_handler.dropped
             }
             
             with open(log_file, 'r', encoding='utf-8') as f:
@@ -0,0 +1,47 @@
+"""
+JSON Provider
+
+Flask JSON provider that encodes responses and parses request bodies with
+orjson instead of the standard library json module.
+"""
+
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    JSON provider backed by orjson.
+    
+    Output matches Flask's default provider: keys are sorted, and dates and
+    other non-native types go through the default provider's ``default``
+    hook, so datetimes are still rendered as HTTP dates.
+    """
+    
+    options = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+    
+    def dumps(self, obj, **kwargs) -> str:
+        """Serialize obj to a JSON string."""
+        if kwargs:
+            # Callers asking for stdlib-specific options get the stdlib encoder
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=self.default, option=self.options).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        """Deserialize a JSON string or bytes, such as a request body."""
+        if kwargs:
+            return super().loads(s, **kwargs)
+        # orjson.JSONDecodeError is a ValueError, so request.get_json() still
+        # answers malformed bodies with 400 Bad Request
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        """Serialize the arguments and wrap them in a JSON response."""
+        obj = self._prepare_response_obj(args, kwargs)
+        options = self.options
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            options |= orjson.OPT_INDENT_2
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=options | orjson.OPT_APPEND_NEWLINE),
+            mimetype=self.mimetype
+        )
@@ -62,28 +62,28 @@ def register_websocket_handlers(socketio):
                     if forfeit_result.get('games_affected', 0) > 0:
                         game_logger.logger.info(f"WebSocket disconnect: User '{username_to_remove}' forfeited {forfeit_result['games_affected']} multiplayer game(s)")
                         
-                        # Find affected games and broadcast game state updates
-                        for game_id, game_data in game_service.games.items():
-                            if (game_data.get("game_mode") == "multiplayer" and 
-                                user_id_to_remove in game_data.get("player_states", {}) and
-                                game_data.get("game_over")):  # Game just ended due to disconnect
-                                
-                                # Broadcast game ended event to remaining players
-                                winner_id = game_data.get("winner")
-                                target_word = game_data.get("target_word", "")
-                                
-                                socketio.emit('game_ended', {
-                                    'game_id': game_id,
-                                    'winner_id': winner_id,
-                                    'target_word': target_word,
-                                    'game_status': 'finished',
-                                    'reason': 'opponent_disconnected'
-                                }, room=f"game_{game_id}")
-                                
-                                # Also broadcast updated game state
-                                broadcast_game_state_update(game_id, socketio)
-                                
-                                game_logger.logger.info(f"Broadcast game end due to disconnect: Game {game_id}, Winner: {winner_id}")
+                        # Broadcast game state updates for the games that just ended due to disconnect
+                        for game_id in forfeit_result['affected_game_ids']:
+                            game_data = game_service.get_game(game_id)
+                            if not game_data:
+                                continue
+                            
+                            # Broadcast game ended event to remaining players
+                            winner_id = game_data.get("winner")
+                            target_word = game_data.get("target_word", "")
+                            
+                            socketio.emit('game_ended', {
+                                'game_id': game_id,
+                                'winner_id': winner_id,
+                                'target_word': target_word,
+                                'game_status': 'finished',
+                                'reason': 'opponent_disconnected'
+                            }, room=f"game_{game_id}")
+                            
+                            # Also broadcast updated game state
+                            broadcast_game_state_update(game_id, socketio)
+                            
+                            game_logger.logger.info(f"Broadcast game end due to disconnect: Game {game_id}, Winner: {winner_id}")
                                 
                 except Exception as e:
                     game_logger.logger.error(f"Error handling multiplayer disconnect for WebSocket user {user_id_to_remove}: {e}")
@@ -316,7 +316,7 @@ def register_websocket_handlers(socketio):
                 }
 
                 # Find opponents and send spell effects
-                game_data = game_service.games.get(game_id)
+                game_data = game_service.get_game(game_id)
                 if game_data:
                     for player in game_data.get("players", []):
                         if player["id"] != caster_id:
@@ -348,7 +348,7 @@ def broadcast_game_state_update(game_id, socketio):
         if not game_service:
             return
         
-        game_data = game_service.games.get(game_id)
+        game_data = game_service.get_game(game_id)
         if not game_data or game_data.get("game_mode") != "multiplayer":
             return
         
@@ -2,11 +2,11 @@
 Wordle Game Server - Main Entry Point
 
 This is the main entry point for the Wordle game server.
-It initializes all services and starts the Flask-SocketIO application.
+It initializes all services and starts the Flask-SocketIO application
+on the development server. Production deployments use wsgi.py instead.
 """
 
 import threading
-import time
 from app import create_app
 from app.config import Config
 from app.services.auth_service import initialize_auth_service, get_auth_service
@@ -15,13 +15,35 @@ from app.services.lobby_service import initialize_lobby_service, get_lobby_servi
 from app.utils.game_logger import game_logger
 
 
-def heartbeat_cleanup_worker(app):
+# Seconds between heartbeat cleanups, and the longest back-off while no one is logged in
+HEARTBEAT_CLEANUP_INTERVAL = 15
+HEARTBEAT_IDLE_MAX_INTERVAL = 60
+
+
+class MockRequest:
+    """Stand-in request object so automatic logouts log like manual ones."""
+    remote_addr = 'system'  # System-initiated
+    method = 'AUTO_LOGOUT'
+    path = '/heartbeat/timeout'
+    url = 'http://system/heartbeat/timeout'
+    endpoint = 'auth.heartbeat_timeout'
+    user_agent = 'Heartbeat Monitor'
+
+    def __init__(self, username):
+        self.username = username
+
+
+def heartbeat_cleanup_worker(app, stop_event):
     """
     Background worker that periodically cleans up expired sessions based on missed heartbeats.
     Runs every 15 seconds to check for users who haven't sent heartbeats.
+    While there are no sessions at all the interval doubles up to 60 seconds,
+    so an idle server does not query the database every 15 seconds.
+    Exits as soon as stop_event is set instead of finishing its current sleep.
     """
     print("Heartbeat cleanup worker started")
-    while True:
+    interval = HEARTBEAT_CLEANUP_INTERVAL
+    while not stop_event.is_set():
         try:
             with app.app_context():
                 auth_service = get_auth_service()
@@ -32,8 +54,16 @@ def heartbeat_cleanup_worker(app):
                     # Clean up sessions that haven't sent heartbeats in the last 10 seconds
                     cleanup_result = auth_service.cleanup_expired_sessions()
                     
+                    # Back off only while no session is stored at all; any session
+                    # may miss its heartbeat and must be noticed promptly. A failed
+                    # cleanup reports no "sessions_remaining" and keeps the normal interval.
+                    if not cleanup_result.get("sessions_remaining", True):
+                        interval = min(interval * 2, HEARTBEAT_IDLE_MAX_INTERVAL)
+                    else:
+                        interval = HEARTBEAT_CLEANUP_INTERVAL
+                    
                     # Debug logging
-                    if cleanup_result["cleaned_count"] > 0:
+                    if Config.DEBUG and cleanup_result["cleaned_count"] > 0:
                         print(f"Heartbeat cleanup found {cleanup_result['cleaned_count']} expired sessions")
                     
                     if cleanup_result["cleaned_count"] > 0:
@@ -75,16 +105,6 @@ def heartbeat_cleanup_worker(app):
                             game_logger.logger.info(f"User '{username}' automatically logged out due to missed heartbeat. Last heartbeat: {last_heartbeat}, Session duration: {session_duration:.1f}s")
                             
                             # Create a mock request object for logging USER_ACTION (same as manual logout)
-                            class MockRequest:
-                                def __init__(self, username):
-                                    self.remote_addr = 'system'  # System-initiated
-                                    self.method = 'AUTO_LOGOUT'
-                                    self.path = '/heartbeat/timeout'
-                                    self.url = 'http://system/heartbeat/timeout'
-                                    self.endpoint = 'auth.heartbeat_timeout'
-                                    self.user_agent = 'Heartbeat Monitor'
-                                    self.username = username
-                            
                             mock_request = MockRequest(username)
                             
                             # Log USER_ACTION logout event (same as manual logout button)
@@ -125,55 +145,75 @@ def heartbeat_cleanup_worker(app):
                 
         except Exception as e:
             game_logger.logger.error(f"Error in heartbeat cleanup worker: {e}")
+            interval = HEARTBEAT_CLEANUP_INTERVAL
         
-        # Wait 15 seconds before next cleanup (reduced for faster testing)
-        time.sleep(15)
+        # Wait before next cleanup
+        if stop_event.wait(interval):
+            break
 
 
-def main():
-    """Main function to initialize services and start the server."""
-    try:
-        # Initialize all services
-        print("Initializing services...")
-        
-        # Initialize authentication service
-        if Config.MONGO_URI and Config.JWT_SECRET:
-            auth_service = initialize_auth_service(Config.MONGO_URI, Config.JWT_SECRET)
-            if auth_service:
-                print("✓ Authentication service initialized successfully")
-            else:
-                print("✗ Failed to initialize authentication service")
-        else:
-            print("✗ MongoDB URI or JWT Secret not configured")
-            auth_service = None
-        
-        # Initialize game service
-        game_service = initialize_game_service()
-        if game_service:
-            print("✓ Game service initialized successfully")
-        else:
-            print("✗ Failed to initialize game service")
-        
-        # Initialize lobby service
-        lobby_service = initialize_lobby_service()
-        if lobby_service:
-            print("✓ Lobby service initialized successfully")
-        else:
-            print("✗ Failed to initialize lobby service")
-        
-        # Create Flask app
-        print("Creating Flask application...")
-        app, socketio = create_app(Config)
-        print("✓ Flask application created successfully")
+def initialize_server(stop_event):
+    """
+    Initialize all services, create the Flask app and start the heartbeat worker.
+    
+    Shared by the development server (main) and the WSGI entry point (wsgi.py).
+    
+    Args:
+        stop_event: threading.Event that stops the heartbeat worker when set
         
-        # Start heartbeat cleanup worker in background thread
+    Returns:
+        Tuple of (app, socketio, auth_service)
+    """
+    # Initialize all services
+    print("Initializing services...")
+    
+    # Initialize authentication service
+    if Config.MONGO_URI and Config.JWT_SECRET:
+        auth_service = initialize_auth_service(Config.MONGO_URI, Config.JWT_SECRET)
         if auth_service:
-            cleanup_thread = threading.Thread(target=heartbeat_cleanup_worker, args=(app,), daemon=True)
-            cleanup_thread.start()
-            print("✓ Heartbeat cleanup worker started - checking every 15 seconds")
-        
-        # Log server startup
-        game_logger.logger.info("Wordle Server Starting - Comprehensive logging, authentication, and heartbeat monitoring enabled")
+            print("✓ Authentication service initialized successfully")
+        else:
+            print("✗ Failed to initialize authentication service")
+    else:
+        print("✗ MongoDB URI or JWT Secret not configured")
+        auth_service = None
+    
+    # Initialize game service
+    game_service = initialize_game_service(Config.REDIS_URL, Config.GAME_TTL_SECONDS)
+    if game_service:
+        print("✓ Game service initialized successfully")
+    else:
+        print("✗ Failed to initialize game service")
+    
+    # Initialize lobby service
+    lobby_service = initialize_lobby_service()
+    if lobby_service:
+        print("✓ Lobby service initialized successfully")
+    else:
+        print("✗ Failed to initialize lobby service")
+    
+    # Create Flask app
+    print("Creating Flask application...")
+    app, socketio = create_app(Config)
+    print("✓ Flask application created successfully")
+    
+    # Start heartbeat cleanup worker in background thread
+    if auth_service:
+        cleanup_thread = threading.Thread(target=heartbeat_cleanup_worker, args=(app, stop_event), daemon=True)
+        cleanup_thread.start()
+        print("✓ Heartbeat cleanup worker started - checking every 15 seconds")
+    
+    # Log server startup
+    game_logger.logger.info("Wordle Server Starting - Comprehensive logging, authentication, and heartbeat monitoring enabled")
+    
+    return app, socketio, auth_service
+
+
+def main():
+    """Main function to initialize services and start the development server."""
+    stop_event = threading.Event()
+    try:
+        app, socketio, auth_service = initialize_server(stop_event)
         
         print(f"\nStarting Wordle Game Server on {Config.HOST}:{Config.PORT}")
         print(f"Debug mode: {Config.DEBUG}")
@@ -190,6 +230,9 @@ def main():
         print(f"Error starting server: {e}")
         game_logger.logger.error(f"Error starting server: {e}")
         raise
+    finally:
+        # Wake the heartbeat worker so it exits without waiting out its sleep
+        stop_event.set()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,24 @@
+"""
+Wordle Game Server - WSGI Entry Point
+
+Builds the application for a production WSGI server instead of the
+development server started by main.py:
+
+    gunicorn -w 1 --threads 100 --keep-alive 75 -b 127.0.0.1:5000 wsgi:app
+
+Lobby rooms and WebSocket connections are tracked in process memory, so run a
+single worker and scale with threads. Do not use --preload: the heartbeat
+cleanup worker is a thread and must be started inside the worker process.
+--keep-alive is kept above the proxy's upstream idle timeout so pooled
+connections are closed by the proxy rather than mid-request by gunicorn.
+"""
+
+import atexit
+import threading
+from main import initialize_server
+
+stop_event = threading.Event()
+app, socketio, auth_service = initialize_server(stop_event)
+
+# Wake the heartbeat worker on worker shutdown
+atexit.register(stop_event.set)